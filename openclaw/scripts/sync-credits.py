@@ -8,13 +8,17 @@ Sync maintainers and contributors in docs/reference/credits.md from git/GitHub.
 Usage: python scripts/sync-credits.py
 """
 
+import json
 import re
 import subprocess
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).parent.parent
 CREDITS_FILE = REPO_ROOT / "docs" / "reference" / "credits.md"
+CACHE_FILE = REPO_ROOT / "scripts" / ".credits-cache.json"
 REPO = "openclaw/openclaw"
 
 # Exclude bot accounts from maintainer list
@@ -56,24 +60,44 @@ EXCLUDED_CONTRIBUTORS = {
     "hyf0-agent",
 }
 
+# Exclusion matching is case-insensitive so bot aliases like "clawd" vs
+# "Clawd" cannot slip through; normalized once at import time
+EXCLUDED_MAINTAINERS_LC = frozenset(s.lower() for s in EXCLUDED_MAINTAINERS)
+EXCLUDED_CONTRIBUTORS_LC = frozenset(s.lower() for s in EXCLUDED_CONTRIBUTORS)
+
 # Minimum merged PRs to be considered a maintainer
 MIN_MERGES = 2
 
 
-# Regex to extract GitHub username from noreply email
-# Matches: ID+username@users.noreply.github.com or username@users.noreply.github.com
-GITHUB_NOREPLY_RE = re.compile(r"^(?:\d+\+)?([^@]+)@users\.noreply\.github\.com$", re.I)
+_NOREPLY_SUFFIX = "@users.noreply.github.com"
 
 
 def extract_github_username(email: str) -> str | None:
-    """Extract GitHub username from noreply email, or return None."""
-    match = GITHUB_NOREPLY_RE.match(email)
-    return match.group(1).lower() if match else None
+    """Extract GitHub username from noreply email, or return None.
+
+    Handles both ID+username@users.noreply.github.com and the older
+    username@users.noreply.github.com form. The endswith prefilter is a
+    single C-level compare, so the common non-noreply case costs no
+    regex machinery.
+    """
+    if not email.endswith(_NOREPLY_SUFFIX):
+        return None
+    local = email[: -len(_NOREPLY_SUFFIX)]
+    plus = local.find("+")
+    if plus >= 0 and local[:plus].isdigit():
+        local = local[plus + 1 :]
+    return local.lower() if local else None
 
 
 def sanitize_name(name: str) -> str:
-    """Sanitize name for MDX by removing curly braces (which MDX interprets as JS)."""
-    return name.replace("{", "").replace("}", "").strip()
+    """Sanitize name for MDX by removing curly braces (which MDX interprets as JS).
+
+    Almost no names contain braces, so only pay for the replace calls
+    when one does.
+    """
+    if "{" in name or "}" in name:
+        name = name.replace("{", "").replace("}", "")
+    return name.strip()
 
 
 def run_git(*args: str) -> str:
@@ -90,6 +114,36 @@ def run_git(*args: str) -> str:
     return result.stdout.strip()
 
 
+def iter_git_lines(*args):
+    """Run git and yield stdout lines (without trailing newline) as they arrive.
+
+    Unlike run_git this does not buffer the full output, so parsing overlaps
+    with git's own work and peak memory stays at one line regardless of
+    history size.
+    """
+    process = subprocess.Popen(
+        ["git", *args],
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        # Keep git's stderr off the terminal: callers treat a nonzero exit
+        # as CalledProcessError (e.g. the stale-SHA rescan fallback), same
+        # as the captured-stderr behaviour of run_git
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1 << 20,
+    )
+    try:
+        for line in process.stdout:
+            yield line.rstrip("\n")
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, ["git", *args])
+
+
 def run_gh(*args: str) -> str:
     """Run gh CLI command and return stdout."""
     result = subprocess.run(
@@ -104,313 +158,408 @@ def run_gh(*args: str) -> str:
     return result.stdout.strip()
 
 
-def categorize_commit_files(files: list[str]) -> str:
-    """Categorize a commit based on its changed files.
+_MERGED_PRS_QUERY = """\
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, states: MERGED, after: $cursor,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { number updatedAt mergedBy { login } }
+    }
+  }
+}"""
+
+
+def load_cache() -> dict:
+    """Load the local sync cache, or an empty dict if missing or corrupt."""
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache: dict) -> None:
+    """Write the sync cache back to disk."""
+    CACHE_FILE.write_text(json.dumps(cache, indent=2) + "\n", encoding="utf-8")
+
+
+def fetch_merged_by(cache: dict) -> dict[str, str]:
+    """Return {pr_number: mergedBy login} for merged PRs, using the cache.
 
-    Returns: 'ci', 'docs only', 'docs', or 'other'
-    - 'ci': any commit with CI files (.github/, scripts/ci*)
-    - 'docs only': only documentation files (docs/ or any .md)
-    - 'docs': docs + other files mixed
-    - 'other': code without CI or docs
+    Merged PRs are immutable, so cached entries never need refetching. We
+    page newest-updated first and stop once we reach activity no newer
+    than the previous sync, turning the API cost into O(new PRs).
+    (GraphQL has no MERGED_AT order field; merging bumps updatedAt, so an
+    updatedAt cutoff is a safe over-approximation.)
     """
-    has_ci = False
-    has_docs = False
-    has_other = False
-
-    for f in files:
-        f_lower = f.lower()
-        if f_lower.startswith(".github/") or f_lower.startswith("scripts/ci"):
-            has_ci = True
-        elif f_lower.startswith("docs/") or f_lower.endswith(".md"):
-            has_docs = True
+    owner, name = REPO.split("/", 1)
+    merged_prs: dict[str, str] = dict(cache.get("merged_prs") or {})
+    last_updated_at = cache.get("pr_last_updated_at") or ""
+    newest_updated_at = last_updated_at
+    cursor: str | None = None
+    done = False
+
+    while not done:
+        args = [
+            "api",
+            "graphql",
+            "-f",
+            f"query={_MERGED_PRS_QUERY}",
+            "-f",
+            f"owner={owner}",
+            "-f",
+            f"name={name}",
+        ]
+        if cursor:
+            args += ["-f", f"cursor={cursor}"]
+        data = json.loads(run_gh(*args))
+        prs = data["data"]["repository"]["pullRequests"]
+        for node in prs["nodes"]:
+            updated_at = node.get("updatedAt") or ""
+            if updated_at > newest_updated_at:
+                newest_updated_at = updated_at
+            if last_updated_at and updated_at <= last_updated_at:
+                done = True
+                break
+            merged_by = node.get("mergedBy")
+            if merged_by and merged_by.get("login"):
+                merged_prs[str(node["number"])] = merged_by["login"]
+        page = prs["pageInfo"]
+        if not page["hasNextPage"]:
+            break
+        cursor = page["endCursor"]
+
+    cache["merged_prs"] = merged_prs
+    cache["pr_last_updated_at"] = newest_updated_at
+    return merged_prs
+
+
+# Push categories in display order; per-user tallies are fixed 4-slot lists
+# indexed by _CAT_IDX rather than a fresh dict per user
+_CATEGORIES = ("ci", "docs only", "docs", "other")
+_CAT_IDX = {category: i for i, category in enumerate(_CATEGORIES)}
+
+# Pathspecs defining the push categories. Git matches these against each
+# commit internally, so no file path text has to cross the pipe; :(icase)
+# keeps the matching case-insensitive like the old lowercased checks.
+_CI_PATHSPEC = (":(icase).github", ":(icase)scripts/ci*")
+_DOCS_PATHSPEC = (":(icase)docs", ":(icase)*.md")
+_OTHER_PATHSPEC = (
+    ".",
+    ":(icase,exclude).github",
+    ":(icase,exclude)scripts/ci*",
+    ":(icase,exclude)docs",
+    ":(icase,exclude)*.md",
+)
+
+
+def count_push_categories(rev: str) -> dict[str, list[int]]:
+    """Tally categorized direct pushes per user for a revision (or range).
+
+    Returns {key: [ci, docs only, docs, other]} per _CAT_IDX, where key is
+    the GitHub username from a noreply email or the lowercased committer
+    name.
+    """
+    push_counts: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0, 0])
+
+    # Let git classify paths internally: one hash-only log per category
+    # pathspec instead of shipping every commit's file list through the pipe
+    log_args = ("log", rev, "--no-merges")
+    ci_commits = set(iter_git_lines(*log_args, "--format=%H", "--", *_CI_PATHSPEC))
+    docs_commits = set(iter_git_lines(*log_args, "--format=%H", "--", *_DOCS_PATHSPEC))
+    other_commits = set(
+        iter_git_lines(*log_args, "--format=%H", "--", *_OTHER_PATHSPEC)
+    )
+
+    for line in iter_git_lines(*log_args, "--format=%H%x1f%cN%x1f%cE"):
+        commit, name, email = line.split("\x1f", 2)
+        email = email.lower()
+        lower_name = name.lower()
+        if not name or lower_name in EXCLUDED_CONTRIBUTORS_LC:
+            continue
+
+        # CI takes priority; docs+other mixed is "docs", pure docs "docs only"
+        if commit in ci_commits:
+            category = "ci"
+        elif commit in other_commits:
+            category = "docs" if commit in docs_commits else "other"
+        elif commit in docs_commits:
+            category = "docs only"
         else:
-            has_other = True
+            # Empty commit: nothing to categorize
+            continue
+
+        # Use GitHub username from noreply email if available
+        gh_user = extract_github_username(email)
+        key = gh_user if gh_user else lower_name
+        push_counts[key][_CAT_IDX[category]] += 1
 
-    # CI takes priority if present
-    if has_ci:
-        return "ci"
-    if has_other:
-        if has_docs:
-            return "docs"  # Mixed: docs + other
-        return "other"  # Pure code
-    if has_docs:
-        return "docs only"  # Pure docs
-    return "other"
+    return push_counts
 
 
-def get_maintainers() -> list[tuple[str, int, dict[str, int]]]:
-    """Get maintainers with (login, merge_count, push_counts_by_category).
+def get_maintainers(cache: dict) -> list[tuple[str, int, list[int], int]]:
+    """Get maintainers with (login, merge_count, push_counts_by_category,
+    total_pushes).
 
     - Merges: from GitHub API (who clicked "merge")
     - Direct pushes: non-merge commits to main (by committer name matching login)
       categorized into 'ci', 'docs', 'other'
     """
-    # 1. Fetch ALL merged PRs using gh pr list (handles pagination automatically)
+    # 1. Fetch merged PRs (cached locally; only new ones hit the API).
+    # Kicked off on a worker thread so the API round-trips overlap the git
+    # scans below instead of running back to back.
     print("  Fetching merged PRs from GitHub API...")
-    output = run_gh(
-        "pr",
-        "list",
-        "--repo",
-        REPO,
-        "--state",
-        "merged",
-        "--limit",
-        "10000",
-        "--json",
-        "mergedBy",
-        "--jq",
-        ".[].mergedBy.login",
-    )
+    executor = ThreadPoolExecutor(max_workers=1)
+    merged_by_future = executor.submit(fetch_merged_by, cache)
+    executor.shutdown(wait=False)
+
+    # 2. Count direct pushes (non-merge commits by committer) with categories.
+    # Incremental: only commits since the last synced SHA are walked, the
+    # delta is folded into the cached per-user tallies.
+    print("  Counting direct pushes from git history...")
+    head_sha = run_git("rev-parse", "main")
+    pushes_state = cache.get("pushes") or {}
+    last_sha = pushes_state.get("last_sha")
+    push_counts = {k: list(v) for k, v in (pushes_state.get("counts") or {}).items()}
+
+    try:
+        delta = count_push_categories(
+            f"{last_sha}..{head_sha}" if last_sha else head_sha
+        )
+    except subprocess.CalledProcessError:
+        # Cached SHA is gone (e.g. history rewrite): fall back to a full scan
+        push_counts = {}
+        delta = count_push_categories(head_sha)
+
+    for key, categories in delta.items():
+        existing = push_counts.get(key)
+        if existing is None:
+            push_counts[key] = categories
+        else:
+            for i, n in enumerate(categories):
+                existing[i] += n
 
-    merge_counts: dict[str, int] = {}
-    if output:
-        for login in output.strip().splitlines():
-            login = login.strip()
-            if login and login not in EXCLUDED_MAINTAINERS:
-                merge_counts[login] = merge_counts.get(login, 0) + 1
+    cache["pushes"] = {"last_sha": head_sha, "counts": push_counts}
 
+    merge_counts = Counter(
+        login
+        for login in merged_by_future.result().values()
+        if login.lower() not in EXCLUDED_MAINTAINERS_LC
+    )
     print(
         f"  Found {sum(merge_counts.values())} merged PRs by {len(merge_counts)} users"
     )
 
-    # 2. Count direct pushes (non-merge commits by committer) with categories
-    # Use GitHub username from noreply emails, or committer name as fallback
-    print("  Counting direct pushes from git history...")
-    # push_counts[key] = {"ci": N, "docs only": N, "docs": N, "other": N}
-    push_counts: dict[str, dict[str, int]] = {}
-
-    # Get commits with files using a delimiter to parse
-    output = run_git(
-        "log", "main", "--no-merges", "--format=COMMIT|%cN|%cE", "--name-only"
-    )
-
-    current_key: str | None = None
-    current_files: list[str] = []
-
-    def flush_commit() -> None:
-        nonlocal current_key, current_files
-        if current_key and current_files:
-            category = categorize_commit_files(current_files)
-            if current_key not in push_counts:
-                push_counts[current_key] = {
-                    "ci": 0,
-                    "docs only": 0,
-                    "docs": 0,
-                    "other": 0,
-                }
-            push_counts[current_key][category] += 1
-        current_key = None
-        current_files = []
-
-    for line in output.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-
-        if line.startswith("COMMIT|"):
-            # Flush previous commit
-            flush_commit()
-            # Parse new commit
-            parts = line.split("|", 2)
-            if len(parts) < 3:
-                continue
-            _, name, email = parts
-            name = name.strip()
-            email = email.strip().lower()
-            if not name or name in EXCLUDED_CONTRIBUTORS:
-                current_key = None
-                continue
-
-            # Use GitHub username from noreply email if available
-            gh_user = extract_github_username(email)
-            current_key = gh_user if gh_user else name.lower()
-        else:
-            # This is a file path
-            if current_key:
-                current_files.append(line)
-
-    # Flush last commit
-    flush_commit()
-
-    # 3. Build maintainer list: anyone with merges >= MIN_MERGES
-    maintainers: list[tuple[str, int, dict[str, int]]] = []
+    # 3. Build maintainer list: anyone with merges >= MIN_MERGES, decorated
+    # with a precomputed (activity, lowered login) sort key
+    decorated = []
 
     for login, merges in merge_counts.items():
         if merges >= MIN_MERGES:
+            lower_login = login.lower()
             # Try to find matching push count (case-insensitive)
-            pushes = push_counts.get(
-                login.lower(), {"ci": 0, "docs only": 0, "docs": 0, "other": 0}
+            pushes = push_counts.get(lower_login, [0, 0, 0, 0])
+            # Summed once here; reused by the sort key and update_credits
+            total_pushes = sum(pushes)
+            decorated.append(
+                (
+                    -(merges + total_pushes),
+                    lower_login,
+                    (login, merges, pushes, total_pushes),
+                )
             )
-            maintainers.append((login, merges, pushes))
 
     # Sort by total activity (merges + sum of pushes) descending
-    maintainers.sort(key=lambda x: (-(x[1] + sum(x[2].values())), x[0].lower()))
-    return maintainers
+    decorated.sort()
+    return [entry for _, _, entry in decorated]
+
 
+# Matches git shortlog -sne lines: "   123\tName <email>"
+_SHORTLOG_RE = re.compile(r"^\s*(\d+)\t(.*) <([^<>]*)>$")
 
-def get_contributors() -> list[tuple[str, int]]:
+
+def count_authors(rev: str) -> dict[str, dict[str, int]]:
+    """Tally commit authors for a revision (or range) via git shortlog.
+
+    Git dedups and counts authors in native code in one pass, so Python
+    only parses one line per unique author instead of one per commit.
+    """
+    authors: dict[str, dict[str, int]] = {}
+    for line in run_git("shortlog", "-sne", rev).splitlines():
+        m = _SHORTLOG_RE.match(line)
+        if not m:
+            continue
+        count, name, email = m.groups()
+        email = email.lower()
+        if not name or not email:
+            continue
+        names = authors.setdefault(email, {})
+        names[name] = names.get(name, 0) + int(count)
+    return authors
+
+
+def get_contributors(cache: dict) -> list[tuple[str, int]]:
     """Get all unique commit authors on main with commit counts.
 
     Merges authors by:
     1. GitHub username (extracted from noreply emails)
     2. Author name matching a known GitHub username
     3. Display name (case-insensitive) as final fallback
-    """
-    output = run_git("log", "main", "--format=%aN|%aE")
-    if not output:
-        return []
 
-    # First pass: collect all known GitHub usernames from noreply emails
+    Incremental: raw per-email name counts are cached keyed on the last
+    synced SHA, so only new commits are parsed; canonicalization is
+    re-derived from the merged counts each run (it needs the global set
+    of known GitHub usernames, so it cannot be cached piecemeal).
+    """
+    head_sha = run_git("rev-parse", "main")
+    authors_state = cache.get("authors") or {}
+    last_sha = authors_state.get("last_sha")
+    email_to_names: dict[str, dict[str, int]] = {
+        email: dict(names)
+        for email, names in (authors_state.get("counts") or {}).items()
+    }
+
+    # git shortlog dedups and counts authors natively, so only one line
+    # per unique author crosses the pipe for the new range
+    rev = f"{last_sha}..{head_sha}" if last_sha else head_sha
+    try:
+        delta = count_authors(rev)
+    except subprocess.CalledProcessError:
+        # Cached SHA is gone (e.g. history rewrite): fall back to a full scan
+        email_to_names = {}
+        delta = count_authors(head_sha)
+
+    for email, names in delta.items():
+        existing = email_to_names.setdefault(email, {})
+        for name, n in names.items():
+            existing[name] = existing.get(name, 0) + n
+
+    cache["authors"] = {"last_sha": head_sha, "counts": email_to_names}
+
+    # All known GitHub usernames from noreply emails (needed before keying,
+    # so name-matches-username merging sees the full set)
     known_github_users: set[str] = set()
-
-    for line in output.splitlines():
-        line = line.strip()
-        if not line or "|" not in line:
-            continue
-        _, email = line.rsplit("|", 1)
-        email = email.strip().lower()
-        if not email:
-            continue
+    for email in email_to_names:
         gh_user = extract_github_username(email)
         if gh_user:
             known_github_users.add(gh_user)
 
-    # Second pass: count commits and pick canonical names
+    # Fold grouped counts into final counts and pick canonical names
     # Key priority: gh:username > name:lowercasename
-    counts: dict[str, int] = {}
-    canonical: dict[str, str] = {}  # key -> preferred display name
-
-    for line in output.splitlines():
-        line = line.strip()
-        if not line or "|" not in line:
-            continue
-        name, email = line.rsplit("|", 1)
-        name = name.strip()
-        email = email.strip().lower()
-        if not name or not email or name in EXCLUDED_CONTRIBUTORS:
-            continue
+    counts: Counter = Counter()
+    # key -> (display name, starts-upper, length); the trailing pair ranks
+    # the name so picking a winner is a single tuple comparison
+    canonical: dict[str, tuple[str, bool, int]] = {}
 
-        # Sanitize name for MDX safety and consistent deduplication
-        sanitized = sanitize_name(name)
-        if not sanitized:
-            continue
-
-        # Determine the merge key:
-        # 1. If email is a noreply email, use the extracted GitHub username
-        # 2. If the author name matches a known GitHub username, use that
-        # 3. Otherwise use the sanitized display name (case-insensitive)
+    for email, names in email_to_names.items():
         gh_user = extract_github_username(email)
-        if gh_user:
-            key = f"gh:{gh_user}"
-        elif sanitized.lower() in known_github_users:
-            key = f"gh:{sanitized.lower()}"
-        else:
-            key = f"name:{sanitized.lower()}"
-
-        counts[key] = counts.get(key, 0) + 1
+        for name, n in names.items():
+            if name.lower() in EXCLUDED_CONTRIBUTORS_LC:
+                continue
 
-        # Prefer capitalized version, or longer name (more specific)
-        if key not in canonical or (
-            (sanitized[0].isupper() and not canonical[key][0].isupper())
-            or (
-                sanitized[0].isupper() == canonical[key][0].isupper()
-                and len(sanitized) > len(canonical[key])
-            )
-        ):
-            canonical[key] = sanitized
+            # Sanitize name for MDX safety and consistent deduplication
+            sanitized = sanitize_name(name)
+            if not sanitized:
+                continue
 
-    # Build list with counts, sorted by count descending then name
-    contributors = [(canonical[key], count) for key, count in counts.items()]
-    contributors.sort(key=lambda x: (-x[1], x[0].lower()))
-    return contributors
+            # Determine the merge key:
+            # 1. If email is a noreply email, use the extracted GitHub username
+            # 2. If the author name matches a known GitHub username, use that
+            # 3. Otherwise use the sanitized display name (case-insensitive)
+            if gh_user:
+                key = f"gh:{gh_user}"
+            elif sanitized.lower() in known_github_users:
+                key = f"gh:{sanitized.lower()}"
+            else:
+                key = f"name:{sanitized.lower()}"
+
+            counts[key] += n
+
+            # Prefer capitalized version, or longer name (more specific)
+            rank = (sanitized[0].isupper(), len(sanitized))
+            current = canonical.get(key)
+            if current is None or rank > current[1:]:
+                canonical[key] = (sanitized, *rank)
+
+    # Build list with counts, sorted by count descending then name; sort on
+    # precomputed (negated count, lowered name) tuples so no key function
+    # runs during the sort itself
+    decorated = [
+        (-count, canonical[key][0].lower(), canonical[key][0])
+        for key, count in counts.items()
+    ]
+    decorated.sort()
+    return [(name, -neg_count) for neg_count, _, name in decorated]
+
+
+def _format_maintainer(
+    login: str, merges: int, push_cats: list[int], total_pushes: int
+) -> str:
+    """Render one maintainer bullet with its categorized push breakdown."""
+    if total_pushes > 0:
+        push_str = ", ".join(
+            f"{count} {category}"
+            for category, count in zip(_CATEGORIES, push_cats)
+            if count > 0
+        )
+        return f"- [@{login}](https://github.com/{login}) ({merges} merges, {total_pushes} direct changes: {push_str})"
+    return f"- [@{login}](https://github.com/{login}) ({merges} merges)"
+
+
+def _replace_section(content: str, header: str, body: str) -> str:
+    """Replace the text between a '## ' header and the next section marker.
+
+    Works on the raw string with find() so only the affected slice is
+    rebuilt; lines outside the section are never touched. Sections end at
+    the next '## ' or '> ' line, or at end of file.
+    """
+    marker = f"\n{header}\n"
+    if content.startswith(f"{header}\n"):
+        start = 0
+    else:
+        start = content.find(marker)
+        if start < 0:
+            return content
+        start += 1  # keep the newline before the header
+    search_from = start + len(header) + 1
+    next_section = content.find("\n## ", search_from)
+    next_quote = content.find("\n> ", search_from)
+    candidates = [i for i in (next_section, next_quote) if i >= 0]
+    end = min(candidates) if candidates else len(content)
+    return f"{content[:start]}{header}\n\n{body}\n{content[end:]}"
 
 
 def update_credits(
-    maintainers: list[tuple[str, int, dict[str, int]]],
+    maintainers: list[tuple[str, int, list[int], int]],
     contributors: list[tuple[str, int]],
 ) -> None:
     """Update the credits.md file with maintainers and contributors."""
     content = CREDITS_FILE.read_text(encoding="utf-8")
 
-    # Build maintainers section (GitHub usernames with profile links)
-    maintainer_lines = []
-    for login, merges, push_cats in maintainers:
-        total_pushes = sum(push_cats.values())
-        if total_pushes > 0:
-            # Build categorized push breakdown
-            push_parts = []
-            if push_cats.get("ci", 0) > 0:
-                push_parts.append(f"{push_cats['ci']} ci")
-            if push_cats.get("docs only", 0) > 0:
-                push_parts.append(f"{push_cats['docs only']} docs only")
-            if push_cats.get("docs", 0) > 0:
-                push_parts.append(f"{push_cats['docs']} docs")
-            if push_cats.get("other", 0) > 0:
-                push_parts.append(f"{push_cats['other']} other")
-            push_str = ", ".join(push_parts)
-            line = f"- [@{login}](https://github.com/{login}) ({merges} merges, {total_pushes} direct changes: {push_str})"
-        else:
-            line = f"- [@{login}](https://github.com/{login}) ({merges} merges)"
-        maintainer_lines.append(line)
-
+    # Build maintainers section (GitHub usernames with profile links),
+    # feeding the join from a generator so no intermediate list is built
     maintainer_section = (
-        "\n".join(maintainer_lines)
-        if maintainer_lines
+        "\n".join(
+            _format_maintainer(login, merges, push_cats, total_pushes)
+            for login, merges, push_cats, total_pushes in maintainers
+        )
+        if maintainers
         else "_No maintainers detected._"
     )
 
     # Build contributors section with commit counts
     # Sanitize names to avoid MDX interpreting special characters (like {}) as JS
-    contributor_lines = [
-        f"{sanitize_name(name)} ({count})" for name, count in contributors
-    ]
     contributor_section = (
-        ", ".join(contributor_lines)
-        if contributor_lines
+        ", ".join(f"{sanitize_name(name)} ({count})" for name, count in contributors)
+        if contributors
         else "_No contributors detected._"
     )
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     contributor_section = f"{len(contributors)} contributors: {contributor_section}\n\n_Last updated: {timestamp}_"
 
-    # Replace sections by finding markers and rebuilding
-    lines = content.split("\n")
-    result = []
-    skip_until_next_section = False
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
-
-        if line == "## Maintainers":
-            result.append(line)
-            result.append("")
-            result.append(maintainer_section)
-            skip_until_next_section = True
-            i += 1
-            continue
-
-        if line == "## Contributors":
-            result.append("")
-            result.append(line)
-            result.append("")
-            result.append(contributor_section)
-            skip_until_next_section = True
-            i += 1
-            continue
-
-        # Check if we hit the next section
-        if skip_until_next_section and (
-            line.startswith("## ") or line.startswith("> ")
-        ):
-            skip_until_next_section = False
-            result.append("")  # blank line before next section
-
-        if not skip_until_next_section:
-            result.append(line)
-
-        i += 1
-
-    content = "\n".join(result)
+    # Splice the two sections in place; the rest of the file is untouched
+    content = _replace_section(content, "## Maintainers", maintainer_section)
+    content = _replace_section(content, "## Contributors", contributor_section)
     CREDITS_FILE.write_text(content, encoding="utf-8")
     print(f"Updated {CREDITS_FILE}")
     print(f"  Maintainers: {len(maintainers)}")
@@ -419,8 +568,16 @@ def update_credits(
 
 def main() -> None:
     print("Syncing credits from git/GitHub...")
-    maintainers = get_maintainers()
-    contributors = get_contributors()
+    cache = load_cache()
+    # The maintainer and contributor scans are independent and I/O-bound
+    # (GitHub API + git), and they write disjoint cache keys, so overlap
+    # them; total wall time is the slower of the two instead of the sum
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        maintainers_future = executor.submit(get_maintainers, cache)
+        contributors_future = executor.submit(get_contributors, cache)
+        maintainers = maintainers_future.result()
+        contributors = contributors_future.result()
+    save_cache(cache)
     update_credits(maintainers, contributors)
 
 